@@ -7,16 +7,37 @@ import argparse
 import json
 import logging
 import os
+import random
+import threading
 import time
-from typing import Callable, Iterable, List, Optional, Tuple, TypeVar
+from typing import Callable, List, Optional, Tuple, TypeVar
 
 from .common import MissingDependencyException, Usage
 
+try:  # optional; noticeably faster (de)serialisation when installed
+    import orjson
+except ImportError:  # pragma: no cover - exercised via stdlib fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+def json_dumps(data) -> str:
+    """Serialise to a JSON string, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False)
+
+
+def json_loads(raw: str | bytes):
+    """Deserialise a JSON string, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class AIBackendBase(ABC):
     """Common base for all AI-powered backends."""
 
@@ -29,6 +50,9 @@ class AIBackendBase(ABC):
     def __init__(self, model="", api_key=None) -> None:
         self.model = model or self.default_model
         self.api_key = api_key
+        self._client_lock = threading.Lock()
+        #: Compiled prompts keyed by their inputs; see _build_prompt overrides.
+        self._prompt_cache: dict = {}
 
     @classmethod
     def contribute_to_cli(cls, parser: argparse.ArgumentParser) -> None:
@@ -83,18 +107,46 @@ class AIBackendBase(ABC):
     def _ensure_client(self):
         if getattr(self, "_client", None):
             return self._client
-        self._client = self._create_client()
+        with self._client_lock:
+            if not getattr(self, "_client", None):
+                self._client = self._create_client()
         return self._client
 
     @abstractmethod
     def _create_client(self):
         """Instantiate the API client."""
 
-    def _iter_chunks(self, items: list, size: int) -> Iterable[list]:
+    def _parse_response_entries(self, raw_text: str | bytes) -> list:
+        """Parse a JSON array response into a list of entries.
+
+        Accepts str or bytes; surrounding whitespace is left to the JSON
+        parser (valid per RFC 8259), avoiding a copy of the whole response.
+        """
+        try:
+            parsed = json_loads(raw_text)
+        except ValueError:
+            # Some models ignore the array instruction and emit one JSON
+            # object per line (NDJSON); parse line-wise before giving up.
+            parsed = [
+                json_loads(line)
+                for line in raw_text.splitlines()
+                if line.strip()
+            ]
+        return parsed if isinstance(parsed, list) else [parsed]
+
+    def _index_response_entries(self, raw_text: str | bytes) -> dict:
+        """Parse a JSON array response into an index -> entry mapping."""
+        return {
+            entry["index"]: entry
+            for entry in self._parse_response_entries(raw_text)
+            if isinstance(entry, dict) and "index" in entry
+        }
+
+    def _iter_chunks(self, items: list, size: int) -> List[list]:
+        """Slice ``items`` into chunks; a list so callers can len() it."""
         if size <= 0:
-            size = len(items)
-        for i in range(0, len(items), size):
-            yield items[i : i + size]
+            size = len(items) or 1
+        return [items[i : i + size] for i in range(0, len(items), size)]
 
     def _resolve_api_key(self) -> str:
         api_key = self.api_key
@@ -106,6 +158,9 @@ class AIBackendBase(ABC):
         return api_key
 
     _retry_delay: float = 0.5
+    _retry_delay_cap: float = 30.0
+    #: Programming errors that retrying cannot fix.
+    _non_retryable: tuple = (TypeError, ValueError)
 
     def _retry(
         self,
@@ -119,18 +174,25 @@ class AIBackendBase(ABC):
         for attempt in range(max_retries + 1):
             try:
                 return fn(*args, **kwargs)
+            except self._non_retryable:
+                raise
             except Exception as exc:
                 last_exc = exc
                 if attempt < max_retries:
+                    # Exponential backoff with jitter so concurrent workers
+                    # don't hammer a rate-limited API in lockstep
+                    delay = min(
+                        self._retry_delay_cap, self._retry_delay * 2**attempt
+                    ) * random.uniform(0.5, 1.5)
                     logger.warning(
                         "%s request failed (attempt %d/%d): %s  " "— retrying in %gs",
                         self.name,
                         attempt + 1,
                         max_retries + 1,
                         exc,
-                        self._retry_delay,
+                        delay,
                     )
-                    time.sleep(self._retry_delay)
+                    time.sleep(delay)
         raise last_exc  # type: ignore[misc]
 
 
@@ -161,18 +223,29 @@ class GeminiMixin:
                 tokens_out=getattr(
                     response.usage_metadata, "candidates_token_count", 0
                 ),
+                tokens_cached=getattr(
+                    response.usage_metadata, "cached_content_token_count", 0
+                )
+                or 0,
             )
             return raw_text, usage
 
         return self._retry(_do_call, retries=retries)
 
     def _call_text(
-        self, client, prompt: List[str], data, retries=None
+        self, client, prompt: str | List[str], data, retries=None
     ) -> Tuple[str, Usage]:
-        """Send a text+JSON request to Gemini."""
+        """Send a text+JSON request to Gemini.
+
+        ``prompt`` and ``data`` may be pre-joined/serialised strings to keep
+        the request prefix byte-identical across chunks.
+        """
+        if not isinstance(prompt, str):
+            prompt = "\n\n".join(prompt)
+        payload = data if isinstance(data, str) else json_dumps(data)
         parts = [
-            {"text": "\n\n".join(prompt)},
-            {"text": json.dumps(data, ensure_ascii=False)},
+            {"text": prompt},
+            {"text": payload},
         ]
         contents = [{"role": "user", "parts": parts}]
         return self._call(client, contents, retries=retries)
@@ -186,6 +259,7 @@ class OpenAIMixin:
 
     def _create_client(self):
         try:
+            import httpx
             from openai import OpenAI
         except ImportError as exc:
             raise MissingDependencyException(self) from exc
@@ -193,6 +267,17 @@ class OpenAIMixin:
         kwargs: dict = {"api_key": api_key}
         if self.base_url:
             kwargs["base_url"] = self.base_url
+        # One pooled client is shared across all (possibly concurrent)
+        # requests of this backend instance; keep-alive connections avoid
+        # per-request TCP+TLS handshakes under the fan-out paths.
+        kwargs["http_client"] = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=32, max_keepalive_connections=32
+            ),
+            # Matches the openai SDK's own default; default_chunk-sized
+            # requests can legitimately run for minutes
+            timeout=600,
+        )
         return OpenAI(**kwargs)
 
     def _call(self, client, messages, retries=None) -> Tuple[str, Usage]:
@@ -204,23 +289,32 @@ class OpenAIMixin:
                 messages=messages,
             )
             raw_text = response.choices[0].message.content.strip()
+            details = getattr(response.usage, "prompt_tokens_details", None)
             usage = Usage(
                 tokens_in=getattr(response.usage, "prompt_tokens", 0),
                 tokens_out=getattr(response.usage, "completion_tokens", 0),
+                tokens_cached=getattr(details, "cached_tokens", 0) or 0,
             )
             return raw_text, usage
 
         return self._retry(_do_call, retries=retries)
 
     def _call_text(
-        self, client, prompt: List[str], data, retries=None
+        self, client, prompt: str | List[str], data, retries=None
     ) -> Tuple[str, Usage]:
-        """Send a text+JSON request via OpenAI-compatible chat."""
+        """Send a text+JSON request via OpenAI-compatible chat.
+
+        ``prompt`` and ``data`` may be pre-joined/serialised strings to keep
+        the request prefix byte-identical across chunks.
+        """
+        if not isinstance(prompt, str):
+            prompt = "\n\n".join(prompt)
+        payload = data if isinstance(data, str) else json_dumps(data)
         messages = [
-            {"role": "system", "content": "\n\n".join(prompt)},
+            {"role": "system", "content": prompt},
             {
                 "role": "user",
-                "content": json.dumps(data, ensure_ascii=False),
+                "content": payload,
             },
         ]
         return self._call(client, messages, retries=retries)
@@ -1,8 +1,14 @@
+import importlib
+
 from .base import Base
-from .gemini import Gemini
-from .grok import Grok
-from .openai import OpenAI
 
+#: Backend name -> "module:Class". Resolved lazily so picking one backend
+#: (or just printing --help) doesn't import the others' heavy dependencies.
+REGISTRY = {
+    "gemini": "audio2sub.aligners.gemini:Gemini",
+    "grok": "audio2sub.aligners.grok:Grok",
+    "openai": "audio2sub.aligners.openai:OpenAI",
+}
 
 __all__ = [
     "Base",
@@ -10,3 +16,12 @@ __all__ = [
     "Grok",
     "OpenAI",
 ]
+
+
+def __getattr__(name):
+    # Keep `aligners.Gemini` etc. working without eager imports
+    for spec in REGISTRY.values():
+        module_name, _, cls_name = spec.partition(":")
+        if cls_name == name:
+            return getattr(importlib.import_module(module_name), cls_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import argparse
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from audio2sub.common import Segment, Usage
-from audio2sub.ai import AIBackendBase
+from audio2sub.ai import AIBackendBase, json_dumps
 
 
 class Base(ABC):
@@ -59,6 +59,22 @@ class AIAligner(AIBackendBase, Base, ABC):
         "- `start` and `end`: aligned timing in seconds (as float numbers)\n"
     )
 
+    @classmethod
+    def contribute_to_cli(cls, parser: argparse.ArgumentParser) -> None:
+        super().contribute_to_cli(parser)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of API requests to keep in flight (default: 1)",
+        )
+
+    @classmethod
+    def opts_from_cli(cls, args: argparse.Namespace) -> dict:
+        opts = super().opts_from_cli(args)
+        opts["concurrency"] = args.concurrency
+        return opts
+
     def align(
         self,
         segments: List[Segment],
@@ -69,6 +85,7 @@ class AIAligner(AIBackendBase, Base, ABC):
         chunk: Optional[int] = None,
         prompt: Optional[str] = None,
         retries: Optional[int] = None,
+        concurrency: Optional[int] = None,
     ) -> List[Segment]:
         """Align segments to reference timing using AI API."""
         prompt_cfg = self._build_prompt(
@@ -77,32 +94,60 @@ class AIAligner(AIBackendBase, Base, ABC):
         client = self._ensure_client()
         usage_tracker = Usage()
         chunk_size = chunk if chunk and chunk > 0 else self.default_chunk
+        chunks = self._iter_alignment_chunks(segments, reference, chunk_size)
 
-        result: List[Segment] = []
-        for seg_batch, ref_batch in self._iter_alignment_chunks(
-            segments, reference, chunk_size
-        ):
-            seg_data = [{"index": s.index, "text": s.text} for s in seg_batch]
-            ref_data = [
+        # The reference is repeated verbatim for every chunk; serialise it
+        # once instead of re-encoding O(chunks x |reference|) JSON.
+        ref_json = json_dumps(
+            [
                 {
                     "index": r.index,
                     "start": r.start,
                     "end": r.end,
                     "text": r.text,
                 }
-                for r in ref_batch
+                for r in reference
             ]
-            input_data = {
-                "segments": seg_data,
-                "reference": ref_data,
-            }
-            raw_text, usage = self._request(
-                client, input_data, prompt_cfg, retries=retries
+        )
+
+        def _request_chunk(seg_batch, ref_batch):
+            seg_json = json_dumps(
+                [{"index": s.index, "text": s.text} for s in seg_batch]
+            )
+            input_data = (
+                '{"segments": ' + seg_json + ', "reference": ' + ref_json + "}"
             )
+            return self._request(client, input_data, prompt_cfg, retries=retries)
+
+        def _serial():
+            for seg_batch, ref_batch in chunks:
+                raw_text, usage = _request_chunk(seg_batch, ref_batch)
+                yield seg_batch, raw_text, usage
+
+        def _concurrent():
+            # Chunks are independent API calls; keep up to `concurrency` in
+            # flight and consume results in submission order.
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(chunks))
+            ) as pool:
+                futures = [
+                    pool.submit(_request_chunk, seg_batch, ref_batch)
+                    for seg_batch, ref_batch in chunks
+                ]
+                for (seg_batch, _), future in zip(chunks, futures):
+                    raw_text, usage = future.result()
+                    yield seg_batch, raw_text, usage
+
+        concurrent = concurrency and concurrency > 1 and len(chunks) > 1
+        result: List[Segment] = []
+        for seg_batch, raw_text, usage in (
+            _concurrent() if concurrent else _serial()
+        ):
             self._parse_response_text(raw_text, seg_batch)
             if usage:
                 usage_tracker.tokens_in += usage.tokens_in
                 usage_tracker.tokens_out += usage.tokens_out
+                usage_tracker.tokens_cached += usage.tokens_cached
                 usage_tracker.export(stats)
             result.extend(seg_batch)
         return result
@@ -111,8 +156,8 @@ class AIAligner(AIBackendBase, Base, ABC):
     def _request(
         self,
         client,
-        input_data: dict,
-        prompt: List[str],
+        input_data: dict | str,
+        prompt: str,
         retries: Optional[int] = None,
     ) -> Tuple[str, Optional[Usage]]:
         """Call the API and return (raw_text, Usage)."""
@@ -122,21 +167,21 @@ class AIAligner(AIBackendBase, Base, ABC):
         segments: List[Segment],
         reference: List[Segment],
         chunk_size: int,
-    ) -> Iterable[Tuple[List[Segment], List[Segment]]]:
+    ) -> List[Tuple[List[Segment], List[Segment]]]:
         """Chunk segments for alignment, keeping full reference."""
         if chunk_size <= 0 or chunk_size >= len(segments):
-            yield segments, reference
-            return
-        for i in range(0, len(segments), chunk_size):
-            seg_batch = segments[i : i + chunk_size]
-            yield seg_batch, reference
+            return [(segments, reference)]
+        return [
+            (segments[i : i + chunk_size], reference)
+            for i in range(0, len(segments), chunk_size)
+        ]
 
     def _build_prompt(
         self,
         src_lang: Optional[str] = None,
         ref_lang: Optional[str] = None,
         prompt: Optional[str] = None,
-    ) -> List[str]:
+    ) -> str:
         prompt_text = self.base_prompt
         if src_lang:
             prompt_text += f"The segments to align are in {src_lang}. "
@@ -155,18 +200,12 @@ class AIAligner(AIBackendBase, Base, ABC):
         system_prompts = [prompt_text]
         if prompt:
             system_prompts.append("Additional instructions:\n" + prompt)
-        return system_prompts
+        # Joined once so every chunk reuses a byte-identical prompt prefix
+        # (helps provider-side prompt caching)
+        return "\n\n".join(system_prompts)
 
     def _parse_response_text(self, raw_text: str, batch: List[Segment]) -> None:
-        raw_text = raw_text.strip()
-        parsed: List[dict] = json.loads(raw_text)
-
-        by_index = {
-            entry.get("index"): entry
-            for entry in parsed
-            if isinstance(entry, dict) and "index" in entry
-        }
-
+        by_index = self._index_response_entries(raw_text)
         for seg in batch:
             entry = by_index.get(seg.index)
             if entry:
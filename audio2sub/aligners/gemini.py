@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 
 from audio2sub.ai import GeminiMixin
 from audio2sub.common import Usage
@@ -13,8 +13,8 @@ class Gemini(GeminiMixin, AIAligner):
     def _request(
         self,
         client,
-        input_data: dict,
-        prompt: List[str],
+        input_data: dict | str,
+        prompt: str,
         retries: Optional[int] = None,
     ) -> Tuple[str, Optional[Usage]]:
         return self._call_text(client, prompt, input_data, retries=retries)
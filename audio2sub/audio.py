@@ -1,6 +1,18 @@
+"""Audio decoding and slicing helpers built on ffmpeg.
+
+A transcription run costs a single ffmpeg invocation: ``read_media_pcm``
+decodes the input once and all segment clips are sliced from the decoded
+PCM in-process.  The remaining helpers each spawn their own ffmpeg
+process and are kept for standalone/fallback use.
+"""
+
+import os
+import wave
 from pathlib import Path
+from typing import Tuple
 
 import ffmpeg
+import numpy as np
 
 
 def convert_media_to_wav(
@@ -44,7 +56,95 @@ def cut_wav_segment(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    stream = ffmpeg.input(str(input_wav), ss=start, to=end).output(
+    # ss before -i seeks the input directly — O(1) for PCM instead of
+    # decoding from the file start; timestamps reset to 0 after an input
+    # seek, so the cut length is expressed as a duration, not an end time
+    stream = ffmpeg.input(str(input_wav), ss=start, t=end - start).output(
         str(output_path), acodec="copy"
     )
     stream.overwrite_output().run(quiet=True)
+
+
+def read_media_pcm(
+    input_path: str | Path,
+    sample_rate: int = 16_000,
+    channels: int = 1,
+) -> Tuple[np.ndarray, int]:
+    """Decode any media file straight to int16 PCM via an ffmpeg pipe.
+
+    Skips the intermediate WAV on disk; returns (samples, sample_rate).
+    """
+
+    input_path = Path(input_path)
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file does not exist: {input_path}")
+
+    # Size the buffer from the container duration so decoded samples stream
+    # straight into it, instead of materialising one huge bytes object and
+    # copying it into an array afterwards
+    try:
+        duration = float(ffmpeg.probe(str(input_path))["format"]["duration"])
+    except Exception:
+        duration = 0.0
+
+    process = (
+        ffmpeg.input(str(input_path))
+        .output("pipe:", format="s16le", ac=channels, ar=sample_rate)
+        .global_args("-loglevel", "error")
+        .run_async(pipe_stdout=True, quiet=True)
+    )
+    if duration > 0:
+        # One second of headroom; ffmpeg may emit slightly more samples
+        capacity = (int(duration * sample_rate) + sample_rate) * channels
+        buf = np.empty(capacity, dtype=np.int16)
+        view = memoryview(buf).cast("B")
+        filled = 0
+        while filled < len(view):
+            read = process.stdout.readinto(view[filled:])
+            if not read:
+                break
+            filled += read
+        tail = process.stdout.read()  # only if the estimate fell short
+        if tail:
+            pcm = np.concatenate(
+                [buf[: filled // 2], np.frombuffer(tail, dtype=np.int16)]
+            )
+        else:
+            pcm = buf[: filled // 2]
+    else:
+        pcm = np.frombuffer(process.stdout.read(), dtype=np.int16)
+    process.communicate()
+
+    if pcm.size == 0:
+        raise RuntimeError("No audio data decoded from input.")
+    return pcm, sample_rate
+
+
+def read_wav_pcm(wav_path: str | Path) -> Tuple[np.ndarray, int]:
+    """Read a PCM WAV file into an int16 sample array and its sample rate."""
+
+    with wave.open(str(wav_path), "rb") as wav:
+        sample_rate = wav.getframerate()
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+    return pcm, sample_rate
+
+
+def cut_wav_segment_np(
+    pcm: np.ndarray,
+    sample_rate: int,
+    start: float,
+    end: float,
+    output_path: str | os.PathLike,
+):
+    """Write one clip of an in-memory mono PCM array as a WAV file.
+
+    Hot-path helper: the parent directory must already exist.
+    """
+
+    clip = pcm[int(start * sample_rate) : int(end * sample_rate)]
+    with wave.open(os.fspath(output_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        # The slice is a view; hand its buffer to wave without a tobytes copy
+        wav.writeframes(np.ascontiguousarray(clip))
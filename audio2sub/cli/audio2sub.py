@@ -1,20 +1,14 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
 
-from tqdm.auto import tqdm
+# Must be set before torch initialises CUDA: lazy module loading defers
+# kernel uploads until first use, cutting context setup time and memory
+os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
 
-try:
-    from .. import transcribers, detectors
-except ImportError:
-    print(
-        "Error: Missing dependencies for audio2sub. Please install with "
-        "`pip install audio2sub[backend]`. See the documentation for more details"
-    )
-    raise
-from ..common import segments_to_srt
-from ..transcribe import transcribe
-from .base import BaseCLI
+from pathlib import Path  # noqa: E402
+
+from .base import BaseCLI  # noqa: E402
 
 
 class Audio2SubCLI(BaseCLI):
@@ -29,8 +23,7 @@ class Audio2SubCLI(BaseCLI):
     backend_short_flag = "-t"
     default_backend_env = "DEFAULT_TRANSCRIBER"
     default_backend = "faster_whisper"
-    backend_module = transcribers
-    backend_base_class = transcribers.Base
+    backend_module_name = "audio2sub.transcribers"
 
     def _add_arguments(self, parser):
         parser.add_argument("input", help="Path to input media file (audio or video)")
@@ -50,12 +43,29 @@ class Audio2SubCLI(BaseCLI):
                 "tokenizer.py for a list of available languages."
             ),
         )
+        parser.add_argument(
+            "--merge-gap",
+            type=float,
+            default=0.3,
+            help=(
+                "Merge neighbouring speech segments closer than this many "
+                "seconds; 0 disables merging (default: 0.3)"
+            ),
+        )
 
     def _add_backend_args(self, parser, backend_args, available):
+        from .. import detectors
+
         detectors.Silero.contribute_to_cli(parser)
         super()._add_backend_args(parser, backend_args, available)
 
     def _run(self, args, available) -> int:
+        # Deferred so --help/--version exit before any of this is imported
+        from tqdm.auto import tqdm
+
+        from .. import detectors
+        from ..transcribe import transcribe
+
         backend = args.transcriber
         input_media = Path(args.input)
         output_srt = Path(args.output)
@@ -75,23 +85,26 @@ class Audio2SubCLI(BaseCLI):
                         total=total,
                         desc=name.capitalize(),
                         leave=True,
+                        mininterval=0.1,
+                        smoothing=0.1,
                         **payload,
                     )
                     bars[name] = bar
-                bar.n = current
-                bar.refresh()
+                # update() lets tqdm throttle rendering to mininterval;
+                # assigning bar.n and refresh()ing would redraw every event
+                bar.update(current - bar.n)
                 if current >= total:
                     bar.close()
                     bars.pop(name, None)
 
         stats = {}
         detector = detectors.Silero.from_cli_args(args)
-        transcriber_cls = available[backend]
+        transcriber_cls = self._get_backend(available, backend)
         transcriber_inst = transcriber_cls.from_cli_args(args)
         batch_opts = transcriber_cls.opts_from_cli(args)
 
         try:
-            segments = transcribe(
+            transcribe(
                 input_media,
                 detector,
                 transcriber_inst,
@@ -99,14 +112,17 @@ class Audio2SubCLI(BaseCLI):
                 reporter=reporter,
                 stats=stats,
                 transcriber_opts=batch_opts,
+                merge_gap=args.merge_gap,
+                output_srt=output_srt,
             )
-            segments_to_srt(segments).save(str(output_srt))
             print(f"SRT written to {output_srt}")
         finally:
             if stats:
-                print("Stats:")
-                for k, v in stats.items():
-                    print(f"  {k}: {v}")
+                # One stdout write instead of one per counter
+                print(
+                    "Stats:\n"
+                    + "\n".join(f"  {k}: {v}" for k, v in stats.items())
+                )
         return 0
 
 
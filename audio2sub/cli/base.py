@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import argparse
-import inspect
+import importlib
 import os
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from .. import __version__
+from ..common import MissingDependencyException
 
 
 class BaseCLI(ABC):
@@ -18,19 +19,40 @@ class BaseCLI(ABC):
     backend_short_flag: str = ""
     default_backend_env: str = ""
     default_backend: str = ""
-    backend_module = None
-    backend_base_class: Type = None
+    #: Dotted path of the backend package; imported lazily so CLI modules
+    #: don't pull backend code in at import time.
+    backend_module_name: str = ""
 
-    def _available_backends(self) -> Dict[str, Type]:
-        module = self.backend_module
-        base_cls = self.backend_base_class
-        if module is None or base_cls is None:
+    #: Memoized per CLI class; the backend set is fixed for the process.
+    _backends: Optional[Dict[str, "Type | str"]] = None
+    _sorted_choices: Optional[list] = None
+
+    def _available_backends(self) -> Dict[str, "Type | str"]:
+        """Map backend names to classes or lazy ``module:Class`` specs."""
+        if self._backends is not None:
+            return self._backends
+        cls = type(self)
+        if not self.backend_module_name:
             return {}
-        return {
-            obj.name: obj
-            for _, obj in inspect.getmembers(module, inspect.isclass)
-            if issubclass(obj, base_cls) and not inspect.isabstract(obj)
-        }
+        module = importlib.import_module(self.backend_module_name)
+        # The explicit registry replaces the old issubclass/isabstract sweep;
+        # specs resolve on first use, so only the selected backend's module
+        # (and its heavy dependencies) ever gets imported
+        cls._backends = dict(module.REGISTRY)
+        return cls._backends
+
+    def _get_backend(self, available: Dict[str, "Type | str"], name: str) -> Type:
+        """Resolve (and cache) a backend class from the available mapping."""
+        backend = available[name]
+        if isinstance(backend, str):
+            module_name, _, cls_name = backend.partition(":")
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError as exc:
+                raise MissingDependencyException(name) from exc
+            backend = getattr(module, cls_name)
+            available[name] = backend
+        return backend
 
     def _build_backend_parser(self, choices: list[str]) -> argparse.ArgumentParser:
         default = os.environ.get(self.default_backend_env, self.default_backend)
@@ -56,12 +78,15 @@ class BaseCLI(ABC):
     ) -> None:
         """Add backend-specific CLI arguments."""
         backend_name = getattr(backend_args, self.backend_arg_name)
-        available[backend_name].contribute_to_cli(parser)
+        self._get_backend(available, backend_name).contribute_to_cli(parser)
 
     def build_parser(
         self, available: Dict[str, Type], args=None
     ) -> argparse.ArgumentParser:
-        backend_parser = self._build_backend_parser(choices=sorted(available.keys()))
+        cls = type(self)
+        if cls._sorted_choices is None:
+            cls._sorted_choices = sorted(available.keys())
+        backend_parser = self._build_backend_parser(choices=cls._sorted_choices)
         backend_args, _ = backend_parser.parse_known_args(args)
 
         parser = argparse.ArgumentParser(
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .. import aligners
-from ..common import segments_to_srt, srt_to_segments
+from ..common import srt_to_segments, write_srt
 from .base import BaseCLI
 
 
@@ -19,8 +18,7 @@ class SubAlignerCLI(BaseCLI):
     backend_short_flag = "-a"
     default_backend_env = "DEFAULT_ALIGNER"
     default_backend = "gemini"
-    backend_module = aligners
-    backend_base_class = aligners.Base
+    backend_module_name = "audio2sub.aligners"
 
     def _add_arguments(self, parser):
         parser.add_argument(
@@ -71,7 +69,7 @@ class SubAlignerCLI(BaseCLI):
         if not reference:
             raise RuntimeError("No subtitle segments found in reference file.")
 
-        aligner_cls = available[args.aligner]
+        aligner_cls = self._get_backend(available, args.aligner)
         aligner_inst = aligner_cls.from_cli_args(args)
         opts = aligner_cls.opts_from_cli(args)
 
@@ -85,13 +83,15 @@ class SubAlignerCLI(BaseCLI):
                 stats=stats,
                 **opts,
             )
-            segments_to_srt(aligned).save(str(output_srt))
+            write_srt(aligned, output_srt)
             print(f"Aligned SRT written to {output_srt}")
         finally:
             if stats:
-                print("Stats:")
-                for k, v in stats.items():
-                    print(f"  {k}: {v}")
+                # One stdout write instead of one per counter
+                print(
+                    "Stats:\n"
+                    + "\n".join(f"  {k}: {v}" for k, v in stats.items())
+                )
         return 0
 
 
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .. import translators
-from ..common import segments_to_srt, srt_to_segments
+from ..common import srt_to_segments, write_srt
 from .base import BaseCLI
 
 
@@ -19,8 +18,7 @@ class SubTranslatorCLI(BaseCLI):
     backend_short_flag = "-t"
     default_backend_env = "DEFAULT_TRANSLATOR"
     default_backend = "gemini"
-    backend_module = translators
-    backend_base_class = translators.Base
+    backend_module_name = "audio2sub.translators"
 
     def _add_arguments(self, parser):
         parser.add_argument("input", help="Path to input SRT subtitle file")
@@ -54,7 +52,7 @@ class SubTranslatorCLI(BaseCLI):
         if not segments:
             raise RuntimeError("No subtitle segments found in input file.")
 
-        translator_cls = available[args.translator]
+        translator_cls = self._get_backend(available, args.translator)
         translator_inst = translator_cls.from_cli_args(args)
         opts = translator_cls.opts_from_cli(args)
 
@@ -67,13 +65,15 @@ class SubTranslatorCLI(BaseCLI):
                 stats=stats,
                 **opts,
             )
-            segments_to_srt(translated).save(str(output_srt))
+            write_srt(translated, output_srt)
             print(f"Translated SRT written to {output_srt}")
         finally:
             if stats:
-                print("Stats:")
-                for k, v in stats.items():
-                    print(f"  {k}: {v}")
+                # One stdout write instead of one per counter
+                print(
+                    "Stats:\n"
+                    + "\n".join(f"  {k}: {v}" for k, v in stats.items())
+                )
         return 0
 
 
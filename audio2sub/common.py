@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
 
 import pysrt
 
+if TYPE_CHECKING:  # numpy is only required by the transcription pipeline
+    import numpy as np
+
 
 @dataclass
 class Segment:
@@ -14,26 +17,34 @@ class Segment:
     end: float
     text: str = ""
     audio: Optional[Path] = None
+    #: In-memory PCM samples; may be a view into a buffer owned by the caller
+    pcm: Optional["np.ndarray"] = None
 
 
 @dataclass
 class Usage:
     tokens_in: int = 0
     tokens_out: int = 0
+    #: Prompt tokens the provider served from its prefix cache (discounted);
+    #: prompts are built byte-identical across chunks to maximise this.
+    tokens_cached: int = 0
 
     def export(self, stats: Optional[dict]) -> None:
         if stats is None:
             return
         stats["tokens_in"] = self.tokens_in
         stats["tokens_out"] = self.tokens_out
+        stats["tokens_cached"] = self.tokens_cached
 
 
 class MissingDependencyException(RuntimeError):
-    def __init__(self, backend) -> None:
-        name = backend.name
+    def __init__(self, backend, extra: Optional[str] = None) -> None:
+        # Accepts a backend instance or a bare backend name; ``extra``
+        # overrides the suggested extra when it differs from the name.
+        name = getattr(backend, "name", backend)
         msg = (
             f"Backend '{name}' is not installed. Install with "
-            f"`pip install audio2sub[{name}]`."
+            f"`pip install audio2sub[{extra or name}]`."
         )
         super().__init__(msg)
 
@@ -41,6 +52,33 @@ class MissingDependencyException(RuntimeError):
 ReporterCallback = Callable[[str, dict], None]
 
 
+def merge_segments(
+    segments: List[Segment],
+    max_gap: float = 0.3,
+    max_duration: float = 30.0,
+) -> List[Segment]:
+    """Merge neighbouring segments separated by at most ``max_gap`` seconds.
+
+    Merged segments never grow beyond ``max_duration`` seconds.  Fewer
+    segments mean fewer clips to cut and fewer transcription requests.
+    """
+    if not segments:
+        return []
+    merged = [segments[0]]
+    for seg in segments[1:]:
+        last = merged[-1]
+        if (
+            seg.start - last.end <= max_gap
+            and seg.end - last.start <= max_duration
+        ):
+            last.end = seg.end
+            if seg.text:
+                last.text = (last.text + " " + seg.text).strip()
+        else:
+            merged.append(seg)
+    return merged
+
+
 def segments_to_srt(segments: Iterable[Segment]) -> pysrt.SubRipFile:
     srt = pysrt.SubRipFile()
     for seg in segments:
@@ -54,16 +92,45 @@ def segments_to_srt(segments: Iterable[Segment]) -> pysrt.SubRipFile:
     return srt
 
 
+def _fmt_srt_time(seconds: float) -> str:
+    ms = round(seconds * 1000)
+    return "%02d:%02d:%02d,%03d" % (
+        ms // 3_600_000,
+        ms // 60_000 % 60,
+        ms // 1000 % 60,
+        ms % 1000,
+    )
+
+
+def segment_to_srt_block(seg: Segment) -> str:
+    """Format one segment as an SRT block (index, timing line, text)."""
+    return (
+        f"{seg.index}\n"
+        f"{_fmt_srt_time(seg.start)} --> {_fmt_srt_time(seg.end)}\n"
+        f"{seg.text}\n\n"
+    )
+
+
+def write_srt(segments: Iterable[Segment], srt_path: str | Path) -> None:
+    """Write segments straight to an SRT file.
+
+    The format is trivial, so formatting blocks directly is much cheaper
+    than building a ``pysrt.SubRipFile`` item by item and serialising it.
+    """
+    with open(srt_path, "w", encoding="utf-8") as file:
+        file.writelines(segment_to_srt_block(seg) for seg in segments)
+
+
 def srt_to_segments(srt_path: str | Path) -> List[Segment]:
     """Read an SRT file and return a list of Segment objects."""
     srt = pysrt.open(str(srt_path))
-    segments: List[Segment] = []
-    for item in srt:
-        seg = Segment(
+    S = Segment  # local binding; skips a global lookup per item
+    return [
+        S(
             index=item.index,
-            start=item.start.ordinal / 1000.0,
-            end=item.end.ordinal / 1000.0,
+            start=item.start.ordinal * 1e-3,
+            end=item.end.ordinal * 1e-3,
             text=item.text,
         )
-        segments.append(seg)
-    return segments
+        for item in srt
+    ]
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
+
 from audio2sub.common import ReporterCallback, Segment
 
 
@@ -22,11 +24,14 @@ class Base(ABC):
         """Instantiate detector from CLI args."""
         return cls()  # pragma: no cover - overridden when needed
 
+    def preload(self) -> None:
+        """Load heavy resources ahead of time (e.g. while audio decodes)."""
+
     @abstractmethod
     def detect(
         self,
-        wav_path: str | Path,
+        audio: str | Path | np.ndarray,
         reporter: Optional[ReporterCallback] = None,
     ) -> List[Segment]:
-        """Detect speech segments in audio file and return list of segments."""
+        """Detect speech segments in an audio file or in-memory PCM array."""
         raise NotImplementedError
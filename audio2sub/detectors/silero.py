@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import argparse
-import math
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, ClassVar, List, Optional
 
 import ffmpeg
 import numpy as np
-import torch
 
-from audio2sub.common import ReporterCallback, Segment
+from audio2sub.common import MissingDependencyException, ReporterCallback, Segment
+
+if TYPE_CHECKING:
+    import torch
 
 from .base import Base
 
@@ -19,6 +20,10 @@ class Silero(Base):
 
     name: str = "silero"
 
+    #: Loaded models shared across instances, keyed by the ``onnx`` flag;
+    #: torch.hub.load costs seconds even with a warm disk cache.
+    _model_cache: ClassVar[dict] = {}
+
     def __init__(
         self,
         sample_rate: int = 16_000,
@@ -28,6 +33,8 @@ class Silero(Base):
         min_silence_duration_ms: int = 100,
         speech_pad_ms: int = 30,
         min_silence_at_max_speech: int = 98,
+        onnx: bool = False,
+        num_threads: Optional[int] = None,
     ) -> None:
         self.sample_rate = sample_rate
         self.threshold = threshold
@@ -36,6 +43,9 @@ class Silero(Base):
         self.min_silence_duration_ms = min_silence_duration_ms
         self.speech_pad_ms = speech_pad_ms
         self.min_silence_at_max_speech = min_silence_at_max_speech
+        self.onnx = onnx
+        self.num_threads = num_threads
+        self._loaded = None
 
     @classmethod
     def contribute_to_cli(cls, parser: argparse.ArgumentParser) -> None:
@@ -85,6 +95,25 @@ class Silero(Base):
                 "in milliseconds (default: 98)"
             ),
         )
+        parser.add_argument(
+            "--vad-backend",
+            choices=("torch", "onnx"),
+            default="torch",
+            help=(
+                "VAD inference backend; onnx is markedly faster on CPU but "
+                "needs onnxruntime installed (default: torch)"
+            ),
+        )
+        parser.add_argument(
+            "--vad-threads",
+            type=int,
+            default=None,
+            help=(
+                "Cap torch's intra-op threads during VAD so it doesn't "
+                "oversubscribe cores; torch backend only, the onnx session "
+                "caps its own pool (default: torch's default)"
+            ),
+        )
 
     @classmethod
     def from_cli_args(cls, args: argparse.Namespace) -> "Silero":
@@ -96,27 +125,49 @@ class Silero(Base):
             min_silence_duration_ms=args.min_silence_duration,
             speech_pad_ms=args.speech_pad,
             min_silence_at_max_speech=args.min_silence_at_max_speech,
+            onnx=args.vad_backend == "onnx",
+            num_threads=args.vad_threads,
         )
 
     def detect(
         self,
-        wav_path: str | Path,
+        audio: str | Path | np.ndarray,
         reporter: Optional[ReporterCallback] = None,
     ) -> List[Segment]:
-        try:
-            model, utils = torch.hub.load(
-                repo_or_dir="snakers4/silero-vad",
-                model="silero_vad",
-                force_reload=False,
-                onnx=False,
-                trust_repo=True,
-            )
-            get_speech_timestamps = utils[0]
-        except Exception as exc:
-            raise RuntimeError(f"Failed to load silero-vad: {exc}") from exc
+        torch = self._import_torch()
+
+        model, get_speech_timestamps = self._ensure_model()
+
+        # Cap torch's intra-op threads so CPU inference doesn't oversubscribe
+        # the cores the rest of the pipeline is using; the onnx wrapper
+        # configures its own session threads, which this can't reach
+        if self.num_threads and not self.onnx:
+            torch.set_num_threads(self.num_threads)
+
+        # Decoded PCM may be passed in directly; otherwise read the file
+        # via an ffmpeg pipe (float32 mono at target sample rate)
+        if isinstance(audio, np.ndarray):
+            wav = self._pcm_to_tensor(audio)
+        else:
+            wav = self._read_audio(audio)
+
+        # The model lives on GPU when one is available; inference there is
+        # several times faster even for a model this small
+        if not self.onnx and torch.cuda.is_available():
+            wav = wav.to("cuda")
+
+        last_progress = 0.0
 
-        # Read WAV via ffmpeg pipe (float32 mono at target sample rate)
-        wav = self._read_audio(wav_path)
+        def _track_progress(p: float) -> None:
+            # Silero fires this at sub-percent granularity; only forward
+            # coarse steps so reporting can't dominate the detection loop
+            nonlocal last_progress
+            p = min(100.0, p)
+            if p - last_progress < 0.5 and p < 100.0:
+                return
+            last_progress = p
+            if reporter:
+                reporter("progress", name="VAD", current=p, total=100.0, unit="%")
 
         timestamps = get_speech_timestamps(
             wav,
@@ -128,39 +179,156 @@ class Silero(Base):
             min_silence_duration_ms=self.min_silence_duration_ms,
             speech_pad_ms=self.speech_pad_ms,
             min_silence_at_max_speech=self.min_silence_at_max_speech,
-            progress_tracking_callback=lambda p: reporter
-            and reporter(
-                "progress",
-                name="VAD",
-                current=math.floor(min(100.0, p) * 100) / 100.0,
-                total=100.0,
-                unit="%",
-            ),
+            progress_tracking_callback=_track_progress,
         )
 
-        segments: List[Segment] = []
-        for idx, ts in enumerate(timestamps, start=1):
-            start = ts.get("start", 0) / self.sample_rate
-            end = ts.get("end", 0) / self.sample_rate
-            if end > start:
-                segments.append(Segment(index=idx, start=start, end=end))
-        return segments
+        if not timestamps:
+            return []
+        # Scale and filter in numpy; only Segment construction stays in Python
+        count = len(timestamps)
+        scale = 1.0 / self.sample_rate
+        starts = np.fromiter(
+            (ts.get("start", 0) for ts in timestamps), dtype=np.int64, count=count
+        ) * scale
+        ends = np.fromiter(
+            (ts.get("end", 0) for ts in timestamps), dtype=np.int64, count=count
+        ) * scale
+        mask = ends > starts
+        S = Segment
+        return [
+            S(index=idx, start=float(start), end=float(end))
+            for idx, (start, end) in enumerate(
+                zip(starts[mask], ends[mask]), start=1
+            )
+        ]
+
+    def preload(self) -> None:
+        """Load the VAD model ahead of time (e.g. while ffmpeg decodes)."""
+        self._ensure_model()
+
+    def _import_torch(self):
+        """Import torch, turning an ImportError into install guidance."""
+        try:
+            import torch
+        except ImportError as exc:
+            # torch ships with every transcription extra
+            raise MissingDependencyException(self, extra="all") from exc
+        return torch
+
+    def _ensure_model(self):
+        """Lazy-load the silero-vad model and timestamp helper."""
+        if self._loaded is None:
+            cached = self._model_cache.get(self.onnx)
+            if cached is None:
+                # Deferred so importing this module (e.g. for --help) stays cheap
+                torch = self._import_torch()
+
+                cached = None if self.onnx else self._load_from_hub_cache(torch)
+                if cached is None:
+                    try:
+                        model, utils = torch.hub.load(
+                            repo_or_dir="snakers4/silero-vad",
+                            model="silero_vad",
+                            force_reload=False,
+                            onnx=self.onnx,
+                            trust_repo=True,
+                        )
+                    except Exception as exc:
+                        raise RuntimeError(
+                            f"Failed to load silero-vad: {exc}"
+                        ) from exc
+                    cached = (model, utils[0])
+                if not self.onnx and torch.cuda.is_available():
+                    cached = (cached[0].to("cuda"), cached[1])
+                self._model_cache[self.onnx] = cached
+            self._loaded = cached
+        return self._loaded
+
+    def _load_from_hub_cache(self, torch):
+        """Load the TorchScript model straight from the torch.hub cache.
+
+        ``torch.hub.load`` re-executes hubconf.py and re-checks the repo on
+        every call even with a warm cache; jit-loading the model file
+        directly skips all of that. Returns ``None`` when the cache (or the
+        expected layout) is absent, in which case the hub path is used.
+        """
+        repo_dir = Path(torch.hub.get_dir()) / "snakers4_silero-vad_master"
+        jit_path = repo_dir / "src" / "silero_vad" / "data" / "silero_vad.jit"
+        utils_path = repo_dir / "src" / "silero_vad" / "utils_vad.py"
+        if not (jit_path.exists() and utils_path.exists()):
+            return None
+        try:
+            import importlib.util
+
+            spec = importlib.util.spec_from_file_location(
+                "silero_vad_utils", utils_path
+            )
+            utils = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(utils)
+            model = torch.jit.load(str(jit_path))
+            model.eval()
+            return model, utils.get_speech_timestamps
+        except Exception:
+            return None
+
+    def _pcm_to_tensor(self, pcm: np.ndarray) -> "torch.Tensor":
+        """Convert an in-memory PCM array to the float32 tensor VAD expects."""
+        import torch
+
+        if pcm.dtype == np.int16:
+            pcm = pcm.astype(np.float32) / 32768.0
+        return torch.from_numpy(np.ascontiguousarray(pcm, dtype=np.float32))
 
-    def _read_audio(self, wav_path: str | Path) -> torch.Tensor:
+    def _read_audio(self, wav_path: str | Path) -> "torch.Tensor":
         """Reads audio file and returns a mono float32 tensor at target sample rate."""
+        import torch
+
+        # Probe the duration so samples stream straight into a preallocated
+        # buffer; the old capture_stdout path held the decoded PCM twice
+        # (bytes + copied array) at peak
+        try:
+            duration = float(ffmpeg.probe(str(wav_path))["format"]["duration"])
+        except Exception:
+            duration = 0.0
+
         process = (
-            ffmpeg.input(str(wav_path))
+            ffmpeg.input(str(wav_path), threads=0)
             .output(
                 "pipe:",
                 format="f32le",
                 ac=1,
                 ar=self.sample_rate,
             )
-            .run(capture_stdout=True, capture_stderr=True)
+            .global_args("-loglevel", "error")
+            .run_async(pipe_stdout=True, quiet=True)
         )
-        audio_bytes, stderr = process
+        if duration > 0:
+            # One second of headroom; ffmpeg may emit slightly more samples
+            capacity = int(duration * self.sample_rate) + self.sample_rate
+            wav_np = np.empty(capacity, dtype=np.float32)
+            view = memoryview(wav_np).cast("B")
+            filled = 0
+            while filled < len(view):
+                read = process.stdout.readinto(view[filled:])
+                if not read:
+                    break
+                filled += read
+            tail = process.stdout.read()  # only if the estimate fell short
+            if tail:
+                wav_np = np.concatenate(
+                    [wav_np[: filled // 4], np.frombuffer(tail, dtype=np.float32)]
+                )
+            else:
+                wav_np = wav_np[: filled // 4]
+            wav = torch.from_numpy(wav_np)
+        else:
+            # bytearray makes the buffer writable so torch.frombuffer can
+            # share it directly — no numpy intermediate, no copy
+            wav = torch.frombuffer(
+                bytearray(process.stdout.read()), dtype=torch.float32
+            )
+        process.communicate()
 
-        wav_np = np.frombuffer(audio_bytes, dtype=np.float32).copy()
-        if wav_np.size == 0:
+        if wav.numel() == 0:
             raise RuntimeError("No audio data decoded from WAV.")
-        return torch.from_numpy(wav_np)
+        return wav
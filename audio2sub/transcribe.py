@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
 from . import detectors, transcribers
-from .audio import convert_media_to_wav, cut_wav_segment
-from .common import ReporterCallback, Segment, Usage
+from .audio import cut_wav_segment_np, read_media_pcm
+from .common import (
+    ReporterCallback,
+    Segment,
+    Usage,
+    merge_segments,
+    segment_to_srt_block,
+)
 
 
 def transcribe(
@@ -19,8 +28,16 @@ def transcribe(
     reporter: Optional[ReporterCallback] = None,
     stats: Optional[Usage | dict] = None,
     transcriber_opts: Optional[dict] = None,
+    merge_gap: float = 0.3,
+    output_srt: Optional[str | Path] = None,
 ) -> List[Segment]:
-    """Convert media to segments using VAD and batch transcription."""
+    """Convert media to segments using VAD and batch transcription.
+
+    Neighbouring VAD segments closer than ``merge_gap`` seconds are merged
+    before cutting; pass ``merge_gap=0`` to disable.  When ``output_srt``
+    is given, subtitle blocks are streamed to that file as each segment
+    comes back instead of requiring a second pass over the results.
+    """
 
     input_media = Path(input_media)
     if not input_media.exists():
@@ -36,39 +53,99 @@ def transcribe(
     )
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        wav_path = Path(tmpdir) / "audio.wav"
         _output("Converting audio...")
-        convert_media_to_wav(input_media, wav_path)
+        # Warm the VAD model and the transcriber's CUDA context in the
+        # background while ffmpeg decodes; detect() falls back to loading
+        # (and raising) itself if this thread failed
+
+        def _preload():
+            try:
+                detector.preload()
+                transcriber.preload()
+            except Exception:
+                pass
+
+        preload = threading.Thread(target=_preload, daemon=True)
+        preload.start()
+        # Decode at the detector's sample rate; detect() interprets the raw
+        # array at that rate, so a mismatch would skew every timestamp
+        pcm, sample_rate = read_media_pcm(
+            input_media, sample_rate=getattr(detector, "sample_rate", 16_000)
+        )
+        preload.join()
 
         _output("Running voice activity detection (VAD)...")
-        segments = detector.detect(wav_path, reporter=reporter)
+        segments = detector.detect(pcm, reporter=reporter)
         if not segments:
             raise RuntimeError("No speech detected by VAD")
+        if merge_gap > 0:
+            segments = merge_segments(
+                segments,
+                max_gap=merge_gap,
+                # Honour the detector's cap (--max-speech-duration) so merging
+                # can't rebuild segments the VAD was told to keep short
+                max_duration=getattr(detector, "max_speech_duration_s", 30.0),
+            )
         total_segments = len(segments)
         _output((f"Detected {total_segments} speech segment(s)."))
         _output("Cutting audio into clips...")
 
-        # Attach indices and extract audio clips for each segment
+        # Attach indices and hand each segment its slice of the decoded PCM
+        # (zero-copy views into `pcm`; valid for the lifetime of this call).
+        # Whisper backends interpret raw arrays as 16 kHz, so at any other
+        # detector rate the views are withheld and the backends fall back to
+        # clip files, whose WAV header carries the real rate.
+        attach_pcm = sample_rate == 16_000
         for idx, seg in enumerate(segments, start=1):
             seg.index = idx
-            seg_path = Path(tmpdir) / f"segment_{idx}.wav"
-            cut_wav_segment(wav_path, seg.start, seg.end, seg_path)
-            seg.audio = seg_path
+            if attach_pcm:
+                seg.pcm = pcm[
+                    int(seg.start * sample_rate) : int(seg.end * sample_rate)
+                ]
+
+        # Backends that can't ingest raw PCM still get clip files, written
+        # in-process from the decoded buffer rather than via ffmpeg
+        if not transcriber.prefers_pcm or not attach_pcm:
+
+            def _cut(seg):
+                seg_path = Path(tmpdir) / f"segment_{seg.index}.wav"
+                cut_wav_segment_np(pcm, sample_rate, seg.start, seg.end, seg_path)
+                seg.audio = seg_path
+
+            # Clip writes are independent and I/O-bound; overlap them across
+            # more threads than cores since each mostly waits on the disk
+            with ThreadPoolExecutor(
+                max_workers=min(16, (os.cpu_count() or 1) * 2)
+            ) as pool:
+                list(pool.map(_cut, segments))
 
         _output("Starting transcription...")
         _progress("transcription", 0, total_segments, unit="seg")
 
-        # Batch transcribe for potential backend optimizations (generator)
-        transcribed_segments: List[Segment] = []
+        # Batch transcribe for potential backend optimizations (generator).
+        # Slot results by index so out-of-order completion keeps ordering.
+        slots: List[Optional[Segment]] = [None] * total_segments
         completed = 0
-        for seg in transcriber.batch_transcribe(
-            segments, lang=lang, stats=stats, **(transcriber_opts or {})
-        ):
-            if seg.text.strip():
-                transcribed_segments.append(seg)
-            completed += 1
-            _progress("transcription", completed, total_segments, unit="seg")
+        srt_file = open(output_srt, "w", encoding="utf-8") if output_srt else None
+        try:
+            for seg in transcriber.batch_transcribe(
+                segments, lang=lang, stats=stats, **(transcriber_opts or {})
+            ):
+                text = seg.text.strip()
+                if text:
+                    seg.text = text
+                    slots[seg.index - 1] = seg
+                    if srt_file:
+                        # Backends yield in index order, so blocks can be
+                        # written as they arrive
+                        srt_file.write(segment_to_srt_block(seg))
+                completed += 1
+                _progress("transcription", completed, total_segments, unit="seg")
+        finally:
+            if srt_file:
+                srt_file.close()
 
+        transcribed_segments = [seg for seg in slots if seg is not None]
         if len(transcribed_segments) == 0:
             raise RuntimeError("Transcription produced no subtitle lines.")
 
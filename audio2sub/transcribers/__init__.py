@@ -1,8 +1,14 @@
+import importlib
+
 from .base import AIAPITranscriber, Base
-from .whisper import Whisper
-from .faster_whisper import FasterWhisper
-from .gemini import Gemini
 
+#: Backend name -> "module:Class". Resolved lazily so picking one backend
+#: (or just printing --help) doesn't import the others' heavy dependencies.
+REGISTRY = {
+    "whisper": "audio2sub.transcribers.whisper:Whisper",
+    "faster_whisper": "audio2sub.transcribers.faster_whisper:FasterWhisper",
+    "gemini": "audio2sub.transcribers.gemini:Gemini",
+}
 
 __all__ = [
     "Base",
@@ -11,3 +17,12 @@ __all__ = [
     "FasterWhisper",
     "Gemini",
 ]
+
+
+def __getattr__(name):
+    # Keep `transcribers.Whisper` etc. working without eager imports
+    for spec in REGISTRY.values():
+        module_name, _, cls_name = spec.partition(":")
+        if cls_name == name:
+            return getattr(importlib.import_module(module_name), cls_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
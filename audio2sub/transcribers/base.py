@@ -1,20 +1,48 @@
 from __future__ import annotations
 
-import json
 import argparse
+import functools
+import mmap
+import os
+import wave
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 import warnings
 
+import numpy as np
+
 from audio2sub.ai import AIBackendBase
+from audio2sub.audio import read_media_pcm
 from audio2sub.common import MissingDependencyException, Segment, Usage
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_device() -> str:
+    """Detect cuda/cpu once per process; availability can't change mid-run."""
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+
+    warnings.warn(
+        "CUDA is not available; performance may be degraded "
+        "significantly. For more information, please refer to the "
+        "README.md of the project."
+    )
+    return "cpu"
+
+
 class Base(ABC):
     """Base class for transcription backends."""
 
     name: str = "base"
+    #: Whether concurrent API requests are safe/useful for this backend.
+    supports_concurrency: bool = False
+    #: Whether the backend can ingest in-memory PCM arrays directly,
+    #: letting the pipeline skip per-segment clip files.
+    prefers_pcm: bool = False
 
     @classmethod
     def contribute_to_cli(cls, parser: argparse.ArgumentParser) -> None:
@@ -30,6 +58,9 @@ class Base(ABC):
         """Extract transcriber-specific options from CLI args."""
         return {}
 
+    def preload(self) -> None:
+        """Warm up heavy resources ahead of time (e.g. while audio decodes)."""
+
     @abstractmethod
     def transcribe(
         self,
@@ -48,9 +79,13 @@ class Base(ABC):
     ) -> Iterable[Segment]:
         """Transcribe a list of segments. Yields updated segments."""
         for seg in segments:
-            if seg.audio is None:
-                raise FileNotFoundError("Segment has no audio path set")
-            text = self.transcribe(str(seg.audio), lang=lang, stats=stats)
+            if self.prefers_pcm and seg.pcm is not None:
+                audio = seg.pcm
+            elif seg.audio is not None:
+                audio = str(seg.audio)
+            else:
+                raise FileNotFoundError("Segment has no audio set")
+            text = self.transcribe(audio, lang=lang, stats=stats)
             seg.text = text
             yield seg
 
@@ -66,6 +101,7 @@ class AIAPITranscriber(AIBackendBase, Base, ABC):
     )
 
     default_chunk: int = 40
+    supports_concurrency: bool = True
 
     @classmethod
     def contribute_to_cli(cls, parser: argparse.ArgumentParser) -> None:
@@ -76,11 +112,18 @@ class AIAPITranscriber(AIBackendBase, Base, ABC):
             required=False,
             help="Context outline to guide transcription",
         )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of API requests to keep in flight (default: 1)",
+        )
 
     @classmethod
     def opts_from_cli(cls, args: argparse.Namespace) -> dict:
         opts = super().opts_from_cli(args)
         opts["outline"] = args.outline
+        opts["concurrency"] = args.concurrency
         return opts
 
     def transcribe(
@@ -106,21 +149,69 @@ class AIAPITranscriber(AIBackendBase, Base, ABC):
         outline: Optional[str] = None,
         prompt: Optional[str] = None,
         retries: Optional[int] = None,
+        concurrency: Optional[int] = None,
     ) -> Iterable[Segment]:
-        """Transcribe segments with shared chunking, prompt, and stats."""
+        """Transcribe segments with shared chunking, prompt, and stats.
+
+        With ``concurrency`` > 1 up to that many chunk requests are kept in
+        flight on a thread pool; results are still consumed in submission
+        order so segments always come back in index order.
+        """
         chunk_size = chunk if chunk and chunk > 0 else self.default_chunk
         prompt_cfg = self._build_prompt(lang=lang, outline=outline, prompt=prompt)
         client = self._ensure_client()
         usage_tracker = Usage()
-
-        for batch in self._iter_chunks(segments, chunk_size):
-            raw_text, usage = self._request_transcription(
-                client, batch, prompt_cfg, retries=retries
-            )
+        batches = self._iter_chunks(segments, chunk_size)
+
+        def _release(payloads):
+            # Dropping the views unmaps the clip data at the batch boundary
+            # instead of whenever the GC gets around to it
+            for _seg, data in payloads:
+                if isinstance(data, memoryview):
+                    data.release()
+
+        def _serial():
+            for batch in batches:
+                payloads = self._segments_to_audio_bytes(batch)
+                raw_text, usage = self._request_transcription(
+                    client, payloads, prompt_cfg, retries=retries
+                )
+                _release(payloads)
+                yield batch, raw_text, usage
+
+        def _concurrent():
+            # Keep up to `concurrency` requests in flight; results are
+            # consumed in submission order so segments come back in order.
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(batches))
+            ) as pool:
+                futures = []
+                for batch in batches:
+                    payloads = self._segments_to_audio_bytes(batch)
+                    futures.append(
+                        (
+                            pool.submit(
+                                self._request_transcription,
+                                client,
+                                payloads,
+                                prompt_cfg,
+                                retries=retries,
+                            ),
+                            payloads,
+                        )
+                    )
+                for batch, (future, payloads) in zip(batches, futures):
+                    raw_text, usage = future.result()
+                    _release(payloads)
+                    yield batch, raw_text, usage
+
+        concurrent = concurrency and concurrency > 1 and len(batches) > 1
+        for batch, raw_text, usage in _concurrent() if concurrent else _serial():
             self._parse_response_text(raw_text, batch)
             if usage:
                 usage_tracker.tokens_in += usage.tokens_in
                 usage_tracker.tokens_out += usage.tokens_out
+                usage_tracker.tokens_cached += usage.tokens_cached
                 usage_tracker.export(stats)
             for seg in batch:
                 yield seg
@@ -129,36 +220,47 @@ class AIAPITranscriber(AIBackendBase, Base, ABC):
     def _request_transcription(
         self,
         client,
-        batch: List[Segment],
-        prompt: List[str],
+        payloads: List[Tuple[Segment, "bytes | memoryview"]],
+        prompt: str,
         retries: Optional[int] = None,
     ) -> Tuple[str, Optional[Usage]]:
-        """Call the provider and return (raw_text_response, Usage)."""
+        """Call the provider and return (raw_text_response, Usage).
+
+        ``payloads`` carries the clip contents already loaded by the base
+        class, so implementations (and their retries) do no disk I/O.
+        """
 
     def _build_prompt(
         self,
         lang: Optional[str],
         outline: Optional[str],
         prompt: Optional[str],
-    ) -> List[str]:
-        prompt_text = self.base_prompt
+    ) -> str:
+        # Inputs are fixed for a batch_transcribe call (and usually for the
+        # instance's lifetime), so compile the text once per combination
+        key = (lang, outline, prompt)
+        cached = self._prompt_cache.get(key)
+        if cached is not None:
+            return cached
+
+        pieces = [self.base_prompt]
         if lang:
-            prompt_text += (
+            pieces.append(
                 " Primary language is "
                 f"{lang}, but audio may include other languages."
             )
-        prompt_text += (
+        pieces.append(
             " Each object's `text` must be the transcription of that specific "
             "clip, with no labels or formatting. Respond as plain JSON text "
             "only; do not include markdown or code fences such as ``` or "
             "other wrappers."
         )
-        prompt_text += (
+        pieces.append(
             '\nRespond with JSON array of objects: [{"index": <clip '
             'index>, "text": <transcription>}, ...].'
         )
 
-        system_prompts = [prompt_text]
+        system_prompts = ["".join(pieces)]
         if outline:
             system_prompts.append(
                 "Outline to guide transcription (context only). *Use the "
@@ -171,18 +273,28 @@ class AIAPITranscriber(AIBackendBase, Base, ABC):
         if prompt:
             system_prompts.append("Additional instructions:\n" + prompt)
 
-        return system_prompts
+        # Joined once so every chunk reuses a byte-identical prompt prefix
+        # (helps provider-side prompt caching)
+        compiled = "\n\n".join(system_prompts)
+        self._prompt_cache[key] = compiled
+        return compiled
 
     def _parse_response_text(self, raw_text: str, batch: List[Segment]) -> None:
-        raw_text = raw_text.strip()
-        parsed: List[dict] = json.loads(raw_text)
-
+        entries = self._parse_response_entries(raw_text)
+        # Responses normally echo the requested order; pair them up directly
+        # and only build an index mapping when they don't
+        if len(entries) == len(batch) and all(
+            isinstance(entry, dict) and entry.get("index") == seg.index
+            for entry, seg in zip(entries, batch)
+        ):
+            for seg, entry in zip(batch, entries):
+                seg.text = entry.get("text", "").strip()
+            return
         by_index = {
-            entry.get("index"): entry
-            for entry in parsed
+            entry["index"]: entry
+            for entry in entries
             if isinstance(entry, dict) and "index" in entry
         }
-
         for seg in batch:
             entry = by_index.get(seg.index)
             if entry:
@@ -190,24 +302,40 @@ class AIAPITranscriber(AIBackendBase, Base, ABC):
 
     def _segments_to_audio_bytes(
         self, batch: List[Segment]
-    ) -> List[Tuple[Segment, bytes]]:
-        payloads: List[Tuple[Segment, bytes]] = []
+    ) -> List[Tuple[Segment, "bytes | memoryview"]]:
+        """Map segments to their clip contents as bytes-like payloads.
+
+        Clips are mmapped rather than read: the kernel pages data in as
+        the upload layer consumes it, with no userspace copy per clip.
+        The views stay valid until released, so retries reuse them.
+        """
+        payloads: List[Tuple[Segment, "bytes | memoryview"]] = []
         for seg in batch:
             if seg.audio is None:
                 raise FileNotFoundError("Segment has no audio path set")
-            audio_path = Path(seg.audio)
-            if not audio_path.exists():
-                raise FileNotFoundError(f"Audio not found: {audio_path}")
-            payloads.append((seg, audio_path.read_bytes()))
+            # open() itself reports a missing file; no separate stat needed
+            with open(seg.audio, "rb") as file:
+                payloads.append(
+                    (
+                        seg,
+                        memoryview(
+                            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                        ),
+                    )
+                )
         return payloads
 
 
 class WhisperBase(Base, ABC):
     """Base class for Whisper-based transcribers"""
 
-    def __init__(self, model_name: str = "turbo") -> None:
+    prefers_pcm: bool = True
+
+    def __init__(self, model_name: str = "turbo", warmup: bool = True) -> None:
         self.model_name = model_name
+        self.warmup = warmup
         self._model = None
+        self._warmed = False
 
     @classmethod
     def contribute_to_cli(cls, parser: argparse.ArgumentParser) -> None:
@@ -216,34 +344,129 @@ class WhisperBase(Base, ABC):
             default="turbo",
             help="Whisper model name (default: turbo)",
         )
+        parser.add_argument(
+            "--no-warmup",
+            action="store_true",
+            help="Skip the dummy warmup inference before transcription",
+        )
 
     @classmethod
     def from_cli_args(cls, args: argparse.Namespace) -> "WhisperBase":
-        return cls(model_name=args.model)
+        return cls(model_name=args.model, warmup=not args.no_warmup)
+
+    def preload(self) -> None:
+        """Create the CUDA context early; first CUDA touch can cost seconds."""
+        try:
+            import torch
+        except ImportError:
+            return
+        if torch.cuda.is_available():
+            torch.empty(1, device="cuda")
+        if self.warmup:
+            self._warm_model()
+
+    def _warm_model(self) -> None:
+        """Absorb first-inference costs (cuDNN autotune, kernel JIT) on a
+        second of silence so the first real segment doesn't pay them."""
+        if self._warmed:
+            return
+        self._warmed = True
+        try:
+            self._transcribe(np.zeros(16_000, dtype=np.float32), lang="en")
+        except Exception:
+            pass  # warmup is best-effort; real inference surfaces errors
+
+    def batch_transcribe(
+        self,
+        segments: List[Segment],
+        lang: Optional[str] = None,
+        stats: Optional[dict] = None,
+    ) -> Iterable[Segment]:
+        """Transcribe segments, decoding the next one while the model runs.
+
+        Segments carrying in-memory PCM are just converted (cheap); file-
+        backed segments are decoded on a worker thread one step ahead of
+        the model so disk/ffmpeg time hides behind GPU compute.
+        """
+
+        def _load(seg: Segment) -> "np.ndarray":
+            if seg.pcm is not None:
+                return self._pcm_to_float(seg.pcm)
+            if seg.audio is None:
+                raise FileNotFoundError("Segment has no audio set")
+            audio = self._fast_load_pcm16(seg.audio)
+            if audio is None:
+                pcm, _rate = read_media_pcm(seg.audio)
+                audio = self._pcm_to_float(pcm)
+            return audio
+
+        if not segments:
+            return
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(_load, segments[0])
+            for i, seg in enumerate(segments):
+                audio = future.result()
+                if i + 1 < len(segments):
+                    future = pool.submit(_load, segments[i + 1])
+                seg.text = self._transcribe(audio, lang, stats)
+                yield seg
 
     def transcribe(
         self,
-        audio_path: str,
+        audio: "str | np.ndarray",
         lang: Optional[str] = None,
         stats: Optional[dict] = None,
     ) -> str:
-        """Transcribe a single audio segment and return text."""
-        audio_path = Path(audio_path)
+        """Transcribe a single audio segment (path or PCM) and return text."""
+        if isinstance(audio, np.ndarray):
+            return self._transcribe(self._pcm_to_float(audio), lang, stats)
+
+        audio_path = Path(audio)
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio not found: {audio_path}")
 
+        fast = self._fast_load_pcm16(audio_path)
+        if fast is not None:
+            return self._transcribe(fast, lang, stats)
         return self._transcribe(audio_path, lang, stats)
 
     @abstractmethod
     def _transcribe(
         self,
-        audio_path: Path,
+        audio: "Path | np.ndarray",
         lang: Optional[str] = None,
         stats: Optional[dict] = None,
     ) -> str:
         """Implementation-specific transcription logic."""
         raise NotImplementedError
 
+    def _pcm_to_float(self, pcm: "np.ndarray") -> "np.ndarray":
+        """Convert PCM samples to the float32 [-1, 1] array Whisper expects."""
+        if pcm.dtype == np.int16:
+            pcm = pcm.astype(np.float32) / 32768.0
+        return np.ascontiguousarray(pcm, dtype=np.float32)
+
+    def _fast_load_pcm16(self, path: "str | os.PathLike") -> "Optional[np.ndarray]":
+        """Load a plain mono 16 kHz PCM16 WAV without spawning ffmpeg.
+
+        Pipeline-produced clips always match this layout; anything else
+        (other rates, channels, compression) returns ``None`` and falls
+        back to the full decoder.
+        """
+        try:
+            with wave.open(os.fspath(path), "rb") as wav:
+                if (
+                    wav.getcomptype() != "NONE"
+                    or wav.getnchannels() != 1
+                    or wav.getframerate() != 16_000
+                    or wav.getsampwidth() != 2
+                ):
+                    return None
+                frames = wav.readframes(wav.getnframes())
+        except (wave.Error, EOFError, OSError):
+            return None
+        return self._pcm_to_float(np.frombuffer(frames, dtype=np.int16))
+
     @abstractmethod
     def _ensure_model(self):
         """Lazy-load and return the Whisper model instance."""
@@ -252,16 +475,6 @@ class WhisperBase(Base, ABC):
     def _get_device(self) -> str:
         """Detect and return the appropriate device (cuda or cpu)."""
         try:
-            import torch
-
-            if torch.cuda.is_available():
-                return "cuda"
-
-            warnings.warn(
-                "CUDA is not available; performance may be degraded "
-                "significantly. For more information, please refer to the "
-                "README.md of the project."
-            )
-            return "cpu"
+            return _detect_device()
         except ImportError as exc:
             raise MissingDependencyException(self) from exc
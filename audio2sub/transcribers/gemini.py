@@ -13,20 +13,31 @@ class Gemini(GeminiMixin, AIAPITranscriber):
     def _request_transcription(
         self,
         client,
-        batch: List[Segment],
-        prompt: List[str],
+        payloads: List[Tuple[Segment, "bytes | memoryview"]],
+        prompt: str,
         retries: Optional[int] = None,
     ) -> Tuple[str, Optional[Usage]]:
-        parts = [{"text": "\n\n".join(prompt)}]
-        parts.extend(self._build_parts(batch=batch))
+        parts = [{"text": prompt}]
+        parts.extend(self._build_parts(payloads))
         contents = [{"role": "user", "parts": parts}]
         return self._call(client, contents, retries=retries)
 
-    def _build_parts(self, batch: List[Segment]) -> List[dict]:
-        parts: List[dict] = []
-        for seg, audio_bytes in self._segments_to_audio_bytes(batch):
-            parts.append({"text": f"Clip {seg.index}"})
-            parts.append(
-                {"inline_data": {"mime_type": "audio/wav", "data": audio_bytes}}
-            )
+    def _build_parts(
+        self, payloads: List[Tuple[Segment, "bytes | memoryview"]]
+    ) -> List[dict]:
+        # Sized up front: two parts per clip, no list regrowth
+        parts: List[dict] = [None] * (2 * len(payloads))
+        pos = 0
+        for seg, audio_bytes in payloads:
+            parts[pos] = {"text": f"Clip {seg.index}"}
+            parts[pos + 1] = {
+                "inline_data": {
+                    "mime_type": "audio/wav",
+                    # google-genai validates parts with pydantic, which
+                    # rejects memoryview for bytes fields; materialise the
+                    # mmapped view here, once per request
+                    "data": bytes(audio_bytes),
+                }
+            }
+            pos += 2
         return parts
@@ -3,6 +3,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from audio2sub.common import MissingDependencyException
 from .base import WhisperBase
 
@@ -14,13 +16,14 @@ class Whisper(WhisperBase):
 
     def _transcribe(
         self,
-        audio_path: Path,
+        audio: "Path | np.ndarray",
         lang: Optional[str] = None,
         stats: Optional[dict] = None,
     ) -> str:
         model, whisper = self._ensure_model()
 
-        audio = whisper.load_audio(str(audio_path))
+        if isinstance(audio, Path):
+            audio = whisper.load_audio(str(audio))
         result = model.transcribe(
             audio,
             language=lang or "en",
@@ -40,5 +43,22 @@ class Whisper(WhisperBase):
             return self._model, whisper
 
         device = self._get_device()
-        self._model = whisper.load_model(self.model_name, device=device)
+        # Load to CPU first: loading straight to CUDA materialises the
+        # checkpoint on cuda:0 before placement, costing a model's worth of
+        # VRAM there even when targeting another device
+        model = whisper.load_model(self.model_name, device="cpu")
+        if device != "cpu":
+            # fp16 weights halve the bytes moved per matmul on what is a
+            # bandwidth-bound workload; decoding already runs fp16 on CUDA
+            model = model.to(device).half()
+        else:
+            try:
+                import torch
+
+                model = torch.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            except Exception:  # pragma: no cover - kernel availability
+                pass  # not every torch build ships the int8 kernels
+        self._model = model
         return self._model, whisper
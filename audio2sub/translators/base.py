@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 import argparse
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 
-from audio2sub.ai import AIBackendBase
+from audio2sub.ai import AIBackendBase, json_dumps
 from audio2sub.common import Segment, Usage
 
 
@@ -43,6 +43,13 @@ class Base(ABC):
 class AITranslator(AIBackendBase, Base, ABC):
     """Base class for AI-based translators."""
 
+    def __init__(self, model="", api_key=None) -> None:
+        super().__init__(model=model, api_key=api_key)
+        #: Completed translations keyed by (src_lang, dst_lang, source text).
+        #: Per-instance, so the model is implicit in the key; hits skip the
+        #: API call (and its token bill) entirely.
+        self._translation_cache: dict = {}
+
     base_prompt: str = (
         "You are a professional subtitle translator. You will receive subtitle "
         "segments as a JSON array of objects with `index` and `text` fields. "
@@ -52,6 +59,22 @@ class AITranslator(AIBackendBase, Base, ABC):
         "Do not add, remove, or merge segments."
     )
 
+    @classmethod
+    def contribute_to_cli(cls, parser: argparse.ArgumentParser) -> None:
+        super().contribute_to_cli(parser)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of API requests to keep in flight (default: 1)",
+        )
+
+    @classmethod
+    def opts_from_cli(cls, args: argparse.Namespace) -> dict:
+        opts = super().opts_from_cli(args)
+        opts["concurrency"] = args.concurrency
+        return opts
+
     def translate(
         self,
         segments: List[Segment],
@@ -61,35 +84,85 @@ class AITranslator(AIBackendBase, Base, ABC):
         chunk: Optional[int] = None,
         prompt: Optional[str] = None,
         retries: Optional[int] = None,
+        concurrency: Optional[int] = None,
     ) -> List[Segment]:
         """Translate segments using AI API with chunking support."""
         chunk_size = chunk if chunk and chunk > 0 else self.default_chunk
-        prompt_cfg = self._build_prompt(
-            src_lang=src_lang, dst_lang=dst_lang, prompt=prompt
-        )
-        client = self._ensure_client()
+
+        # Short phrases repeat a lot in subtitles ("Yes.", "Thank you.",
+        # speaker tags); translate each distinct text once per run and fill
+        # the rest from the cache afterwards.
+        cache = self._translation_cache
+        source_keys: dict = {}
+        in_flight: set = set()
+        deferred: List[Tuple[Segment, tuple]] = []
+        pending: List[Segment] = []
+        for seg in segments:
+            key = (src_lang, dst_lang, seg.text)
+            if key in cache or key in in_flight:
+                deferred.append((seg, key))
+            else:
+                in_flight.add(key)
+                source_keys[id(seg)] = key
+                pending.append(seg)
+
+        if pending:
+            prompt_cfg = self._build_prompt(
+                src_lang=src_lang, dst_lang=dst_lang, prompt=prompt
+            )
+            client = self._ensure_client()
         usage_tracker = Usage()
+        batches = self._iter_chunks(pending, chunk_size) if pending else []
 
-        result: List[Segment] = []
-        for batch in self._iter_chunks(segments, chunk_size):
-            input_data = [{"index": seg.index, "text": seg.text} for seg in batch]
-            raw_text, usage = self._request(
-                client, input_data, prompt_cfg, retries=retries
+        def _request_batch(batch):
+            # Serialised here, once per batch; _call_text passes strings
+            # through untouched, so nothing re-encodes the payload downstream
+            input_data = json_dumps(
+                [{"index": seg.index, "text": seg.text} for seg in batch]
             )
+            return self._request(client, input_data, prompt_cfg, retries=retries)
+
+        def _serial():
+            for batch in batches:
+                raw_text, usage = _request_batch(batch)
+                yield batch, raw_text, usage
+
+        def _concurrent():
+            # Batches are independent API calls; keep up to `concurrency` in
+            # flight and consume results in submission order.
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(batches))
+            ) as pool:
+                futures = [pool.submit(_request_batch, batch) for batch in batches]
+                for batch, future in zip(batches, futures):
+                    raw_text, usage = future.result()
+                    yield batch, raw_text, usage
+
+        concurrent = concurrency and concurrency > 1 and len(batches) > 1
+        for batch, raw_text, usage in _concurrent() if concurrent else _serial():
             self._parse_response_text(raw_text, batch)
+            for seg in batch:
+                key = source_keys[id(seg)]
+                # A segment missing from the response keeps its source text;
+                # caching that would pin the untranslated line for every
+                # duplicate and later run
+                if seg.text != key[2]:
+                    cache[key] = seg.text
             if usage:
                 usage_tracker.tokens_in += usage.tokens_in
                 usage_tracker.tokens_out += usage.tokens_out
+                usage_tracker.tokens_cached += usage.tokens_cached
                 usage_tracker.export(stats)
-            result.extend(batch)
-        return result
+        for seg, key in deferred:
+            seg.text = cache.get(key, seg.text)
+        return list(segments)
 
     @abstractmethod
     def _request(
         self,
         client,
-        input_data: List[dict],
-        prompt: List[str],
+        input_data: "List[dict] | str",
+        prompt: str,
         retries: Optional[int] = None,
     ) -> Tuple[str, Optional[Usage]]:
         """Call the API and return (raw_text, Usage)."""
@@ -99,7 +172,7 @@ class AITranslator(AIBackendBase, Base, ABC):
         src_lang: str,
         dst_lang: str,
         prompt: Optional[str] = None,
-    ) -> List[str]:
+    ) -> str:
         prompt_text = self.base_prompt.format(src_lang=src_lang, dst_lang=dst_lang)
         prompt_text += (
             " Each object's `text` must be the translation of the "
@@ -115,18 +188,26 @@ class AITranslator(AIBackendBase, Base, ABC):
         system_prompts = [prompt_text]
         if prompt:
             system_prompts.append("Additional instructions:\n" + prompt)
-        return system_prompts
+        # Joined once so every chunk reuses a byte-identical prompt prefix
+        # (helps provider-side prompt caching)
+        return "\n\n".join(system_prompts)
 
     def _parse_response_text(self, raw_text: str, batch: List[Segment]) -> None:
-        raw_text = raw_text.strip()
-        parsed: List[dict] = json.loads(raw_text)
-
+        entries = self._parse_response_entries(raw_text)
+        # Responses normally echo the requested order; pair them up directly
+        # and only build an index mapping when they don't
+        if len(entries) == len(batch) and all(
+            isinstance(entry, dict) and entry.get("index") == seg.index
+            for entry, seg in zip(entries, batch)
+        ):
+            for seg, entry in zip(batch, entries):
+                seg.text = entry.get("text", "").strip()
+            return
         by_index = {
-            entry.get("index"): entry
-            for entry in parsed
+            entry["index"]: entry
+            for entry in entries
             if isinstance(entry, dict) and "index" in entry
         }
-
         for seg in batch:
             entry = by_index.get(seg.index)
             if entry:
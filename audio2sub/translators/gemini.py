@@ -13,8 +13,8 @@ class Gemini(GeminiMixin, AITranslator):
     def _request(
         self,
         client,
-        input_data: List[dict],
-        prompt: List[str],
+        input_data: "List[dict] | str",
+        prompt: str,
         retries: Optional[int] = None,
     ) -> Tuple[str, Optional[Usage]]:
         return self._call_text(client, prompt, input_data, retries=retries)
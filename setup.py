@@ -1,8 +1,22 @@
 from pathlib import Path
 from setuptools import find_packages, setup
+import ast
 import os
 import re
 
+METADATA_RE = re.compile(r"(__\w+?__)\s*=\s*(.+)$")
+# Keys setup() actually consumes; stop scanning once all are found.
+METADATA_KEYS = frozenset(
+    (
+        "__title__",
+        "__version__",
+        "__author__",
+        "__author_email__",
+        "__url__",
+        "__description__",
+    )
+)
+
 this_directory = Path(__file__).parent
 readme_path = this_directory / "README.md"
 long_description = readme_path.read_text(encoding="utf-8")
@@ -10,11 +24,12 @@ long_description = readme_path.read_text(encoding="utf-8")
 package = dict()
 
 with open(os.path.join("audio2sub", "__init__.py"), "r") as f:
-    lines = f.readlines()
-    for line in lines:
-        match = re.match(r"(__\w+?__)\s*=\s*(.+)$", line)
-        if match and match.group(1) != "__all__":
-            package[match.group(1)] = eval(match.group(2))
+    for line in f:
+        match = METADATA_RE.match(line)
+        if match and match.group(1) in METADATA_KEYS:
+            package[match.group(1)] = ast.literal_eval(match.group(2))
+            if len(package) == len(METADATA_KEYS):
+                break
 
 transcriber_requirements = {
     "ffmpeg-python>=0.2.0",
@@ -69,7 +84,8 @@ setup(
         "gemini": transcriber_requirements | gemini_requirements,
         "subtranslator": gemini_requirements | openai_requirements,
         "subaligner": gemini_requirements | openai_requirements,
-        "dev": all_requirements | {"pytest>=7.4.0"},
+        "dev": all_requirements
+        | {"pytest>=7.4.0", "pytest-xdist>=3.3.0", "pytest-recording>=0.13"},
         "all": all_requirements,
     },
     entry_points={
@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """pytest-recording settings for the API-backed tests.
+
+    First run records each HTTP exchange to a cassette under
+    ``tests/cassettes/``; later runs replay from disk and never touch the
+    network. Credentials must not end up in the recordings.
+    """
+    return {
+        "filter_headers": ["authorization", "x-api-key", "x-goog-api-key"],
+    }
@@ -5,42 +5,114 @@ Checks that the output is in English and that key words appear.
 """
 
 import os
+import re
+from dataclasses import replace
+from operator import attrgetter
+from time import perf_counter
+
 import pytest
 
 from audio2sub import Segment
 from audio2sub.translators import Gemini, Grok, OpenAI
 
 
-CHINESE_SEGMENTS = [
+# A tuple so nothing can accidentally mutate the shared originals
+CHINESE_SEGMENTS = (
     Segment(index=1, start=0.0, end=3.0, text="因此，我的美国同胞们，"),
     Segment(index=2, start=3.0, end=5.0, text="不要问你的国家能为你做什么，"),
     Segment(index=3, start=5.0, end=8.0, text="而要问你能为你的国家做什么。"),
+)
+
+EXPECTED_KEYWORDS = ("country", "ask", "fellow")
+# One pass over the text instead of one scan per keyword; no \b anchors so
+# substring semantics stay identical to the old `kw in text` checks
+# ("asking" still counts for "ask")
+_KEYWORDS_RE = re.compile("|".join(map(re.escape, EXPECTED_KEYWORDS)))
+
+_get_text = attrgetter("text")
+
+# Regression ceilings for the three-segment fixture. Tripping one means the
+# system prompt or response format has bloated (or a provider stalled), not
+# that the translation is wrong. Output is generous because reasoning models
+# (e.g. grok-3-mini) bill their thinking tokens as completion tokens.
+STATS_LIMITS = {
+    "tokens_in": 500,
+    "tokens_out": 1000,
+    "duration_s": 60.0,
+}
+
+TRANSLATORS = [
+    pytest.param(
+        Gemini,
+        id="gemini",
+        marks=pytest.mark.skipif(
+            bool(os.environ.get("SKIP_GEMINI_TEST")),
+            reason="SKIP_GEMINI_TEST environment variable is set",
+        ),
+    ),
+    pytest.param(
+        Grok,
+        id="grok",
+        marks=pytest.mark.skipif(
+            bool(os.environ.get("SKIP_GROK_TEST")),
+            reason="SKIP_GROK_TEST environment variable is set",
+        ),
+    ),
+    pytest.param(
+        OpenAI,
+        id="openai",
+        marks=pytest.mark.skipif(
+            bool(os.environ.get("SKIP_OPENAI_TEST")),
+            reason="SKIP_OPENAI_TEST environment variable is set",
+        ),
+    ),
 ]
 
-EXPECTED_KEYWORDS = ["country", "ask", "fellow"]
+
+@pytest.fixture(scope="module")
+def translators():
+    """One instance per backend class, built lazily and reused for the
+    module, so SDK client construction and its TLS connection happen once
+    per backend rather than per parametrized run."""
+    return {}
+
+
+@pytest.fixture
+def segments():
+    """A fresh copy per test; translators mutate segment text in place."""
+    return [replace(s) for s in CHINESE_SEGMENTS]
 
 
 def _is_mostly_english(text: str) -> bool:
     """Check if the text is predominantly English (ASCII characters)."""
-    if not text.strip():
+    n = len(text)
+    if not n or text.isspace():
         return False
-    ascii_chars = sum(1 for c in text if ord(c) < 128)
-    return ascii_chars / len(text) > 0.7
+    # Single C-level pass; the codec drops non-ASCII characters
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    # Integer form of ascii_chars / n > 0.7
+    return ascii_chars * 10 > n * 7
 
 
 def _assert_translation_quality(translated_segments):
     """Assert that translation output is valid and in English."""
     assert len(translated_segments) == len(CHINESE_SEGMENTS)
 
-    full_text = " ".join(seg.text for seg in translated_segments).lower()
+    # map + attrgetter keeps the attribute dispatch in C for the join
+    full_text = " ".join(map(_get_text, translated_segments)).lower()
 
     # Check that output is in English
     assert _is_mostly_english(
         full_text
     ), f"Translation does not appear to be in English: {full_text}"
 
-    # Check that at least some expected keywords appear
-    found = [kw for kw in EXPECTED_KEYWORDS if kw in full_text]
+    # Check that at least some expected keywords appear; stop scanning as
+    # soon as two distinct ones have been seen
+    found = set()
+    for match in _KEYWORDS_RE.finditer(full_text):
+        found.add(match.group())
+        if len(found) >= 2:
+            break
     assert len(found) >= 2, (
         f"Expected at least 2 of {EXPECTED_KEYWORDS} in translation, "
         f"but only found {found}. Full text: {full_text}"
@@ -57,53 +129,24 @@ def _assert_translation_quality(translated_segments):
         ), f"Index mismatch: expected {orig.index}, got {trans.index}"
 
 
-@pytest.mark.skipif(
-    bool(os.environ.get("SKIP_GEMINI_TEST")),
-    reason="SKIP_GEMINI_TEST environment variable is set",
-)
-def test_gemini_translator():
-    translator = Gemini()
-    # Copy segments to avoid mutation
-    segments = [
-        Segment(index=s.index, start=s.start, end=s.end, text=s.text)
-        for s in CHINESE_SEGMENTS
-    ]
-    stats = {}
-    result = translator.translate(segments, "zh", "en", stats=stats)
-    _assert_translation_quality(result)
-    assert stats.get("tokens_in", 0) > 0
-    assert stats.get("tokens_out", 0) > 0
-
-
-@pytest.mark.skipif(
-    bool(os.environ.get("SKIP_GROK_TEST")),
-    reason="SKIP_GROK_TEST environment variable is set",
-)
-def test_grok_translator():
-    translator = Grok()
-    segments = [
-        Segment(index=s.index, start=s.start, end=s.end, text=s.text)
-        for s in CHINESE_SEGMENTS
-    ]
-    stats = {}
-    result = translator.translate(segments, "zh", "en", stats=stats)
-    _assert_translation_quality(result)
-    assert stats.get("tokens_in", 0) > 0
-    assert stats.get("tokens_out", 0) > 0
-
-
-@pytest.mark.skipif(
-    bool(os.environ.get("SKIP_OPENAI_TEST")),
-    reason="SKIP_OPENAI_TEST environment variable is set",
-)
-def test_openai_translator():
-    translator = OpenAI()
-    segments = [
-        Segment(index=s.index, start=s.start, end=s.end, text=s.text)
-        for s in CHINESE_SEGMENTS
-    ]
+@pytest.mark.vcr
+@pytest.mark.parametrize("cls", TRANSLATORS)
+def test_translator(cls, translators, segments):
+    if cls not in translators:
+        translators[cls] = cls()
+    translator = translators[cls]
     stats = {}
+    start = perf_counter()
     result = translator.translate(segments, "zh", "en", stats=stats)
+    stats["duration_s"] = perf_counter() - start
     _assert_translation_quality(result)
     assert stats.get("tokens_in", 0) > 0
     assert stats.get("tokens_out", 0) > 0
+    # Exported whenever the provider reports it; a cache hit is a bonus,
+    # not a guarantee, so only the key's presence and sign are checked
+    assert stats.get("tokens_cached", 0) >= 0
+    for key, limit in STATS_LIMITS.items():
+        assert stats[key] < limit, (
+            f"{key} regressed: {stats[key]} >= {limit} "
+            f"(full stats: {stats})"
+        )